@@ -23,21 +23,32 @@ import atexit
 
 import re
 from argparse import ArgumentParser
+from functools import cached_property
 from git import Git, GitCommandError
-from github import GithubException
-from github.Repository import Repository
-from os import makedirs
-from os.path import join, exists, isdir
+from os import scandir
+from os.path import join
+from pathlib import Path
 from shutil import rmtree
-from subprocess import call
-from typing import Callable, Optional
+from string import ascii_letters
+from typing import Callable, Optional, TYPE_CHECKING
 
 from msk.console_action import ConsoleAction
 from msk.exceptions import GithubRepoExists, UnrelatedGithubHistory
-from msk.lazy import Lazy
 from msk.util import ask_input, to_camel, ask_yes_no, ask_input_lines, \
     print_error
 
+if TYPE_CHECKING:
+    from github.Repository import Repository
+
+_NAME_CHARS = frozenset(ascii_letters + ' -')
+_ENTITY_RE = re.compile(r'(?<={)[a-z_A-Z]*(?=})')
+_DASH_TO_SPACE = str.maketrans('-', ' ')
+
+
+def _valid_name(name: str) -> bool:
+    return bool(name) and _NAME_CHARS.issuperset(name)
+
+
 readme_template = '''## {title_name}
 {short_description}
 
@@ -77,46 +88,48 @@ settings.json
 
 '''
 
-settingsmeta_template = '''{{
+settingsmeta_template = '''{
     "name": "{capital_desc}",
-    "skillMetadata": {{
+    "skillMetadata": {
         "sections": [
-            {{
+            {
                 "name": "Options << Name of section",
                 "fields": [
-                    {{
+                    {
                         "name": "internal_python_variable_name",
                         "type": "text",
                         "label": "Setting Friendly Display Name",
                         "value": "",
                         "placeholder": "demo prompt in the input box"
-                    }}
+                    }
                 ]
-            }},
-            {{
+            },
+            {
                 "name": "Login << Name of another section",
                 "fields": [
-                    {{
+                    {
                         "type": "label",
                         "label": "Just a little bit of extra info for the user to understand following settings"
-                    }},
-                    {{
+                    },
+                    {
                         "name": "username",
                         "type": "text",
                         "label": "Username",
                         "value": ""
-                    }},
-                    {{
+                    },
+                    {
                         "name": "password",
                         "type": "password",
                         "label": "Password",
                         "value": ""
-                    }}
+                    }
                 ]
-            }}
+            }
         ]
-    }}
-}}'''
+    }
+}'''
+
+_settingsmeta_prefix, _settingsmeta_suffix = settingsmeta_template.split('{capital_desc}')
 
 
 class CreateAction(ConsoleAction):
@@ -128,15 +141,26 @@ class CreateAction(ConsoleAction):
     def register(parser: ArgumentParser):
         pass
 
-    @Lazy
+    @cached_property
+    def name_to_skill(self) -> dict:
+        """Installed skills by name, also keyed without the -skill suffix"""
+        skills = self.msm.list()
+        name_to_skill = {
+            skill.name[:-len('-skill')]: skill
+            for skill in skills if skill.name.endswith('-skill')
+        }
+        name_to_skill.update((skill.name, skill) for skill in skills)
+        return name_to_skill
+
+    @cached_property
     def name(self) -> str:
-        name_to_skill = {skill.name: skill for skill in self.msm.list()}
+        name_to_skill = self.name_to_skill
         while True:
             name = ask_input(
                 'Enter a short unique skill name (ie. "siren alarm" or "pizza orderer"):',
-                lambda x: re.match(r'^[a-zA-Z \-]+$', x), 'Please use only letter and spaces.'
+                _valid_name, 'Please use only letter and spaces.'
             ).strip(' -').lower().replace(' ', '-')
-            skill = name_to_skill.get(name, name_to_skill.get('{}-skill'.format(name)))
+            skill = name_to_skill.get(name)
             if skill:
                 print('The skill {} {}already exists'.format(
                     skill.name, 'by {} '.format(skill.author) * bool(skill.author)
@@ -145,7 +169,7 @@ class CreateAction(ConsoleAction):
                     rmtree(skill.path)
                 else:
                     continue
-            class_name = '{}Skill'.format(to_camel(name.replace('-', '_')))
+            class_name = self.make_class_name(name)
             repo_name = '{}-skill'.format(name)
             print()
             print('Class name:', class_name)
@@ -153,111 +177,170 @@ class CreateAction(ConsoleAction):
             print()
             alright = ask_yes_no('Looks good? (Y/n)', True)
             if alright:
+                self.class_name = class_name
                 return name
 
-    path = Lazy(lambda s: join(s.msm.skills_dir, s.name + '-skill'))
-    git = Lazy(lambda s: Git(s.path))
-    short_description = Lazy(lambda s: ask_input(
-        'Enter a one line description for your skill (ie. Orders fresh pizzas from the store):',
-    ).capitalize())
-    author = Lazy(lambda s: ask_input('Enter author:'))
-    intent_lines = Lazy(lambda s: [
-        i.capitalize() for i in ask_input_lines(
-            'Enter some example phrases to trigger your skill:', '-'
+    @staticmethod
+    def make_class_name(name: str) -> str:
+        return '{}Skill'.format(to_camel(name.replace('-', '_')))
+
+    @cached_property
+    def class_name(self) -> str:
+        return self.make_class_name(self.name)
+
+    @cached_property
+    def path(self) -> str:
+        return join(self.msm.skills_dir, self.name + '-skill')
+
+    @cached_property
+    def git(self) -> Git:
+        return Git(self.path)
+
+    @cached_property
+    def short_description(self) -> str:
+        return ask_input(
+            'Enter a one line description for your skill (ie. Orders fresh pizzas from the store):',
+        ).capitalize()
+
+    @cached_property
+    def author(self) -> str:
+        return ask_input('Enter author:')
+
+    @cached_property
+    def intent_lines(self) -> list:
+        return [
+            i[:1].upper() + i[1:] for i in ask_input_lines(
+                'Enter some example phrases to trigger your skill:', '-'
+            )
+        ]
+
+    @cached_property
+    def dialog_lines(self) -> list:
+        return [
+            i[:1].upper() + i[1:] for i in ask_input_lines(
+                'Enter what your skill should say to respond:', '-'
+            )
+        ]
+
+    @cached_property
+    def intent_entities(self) -> set:
+        return set(_ENTITY_RE.findall('\n'.join(self.intent_lines)))
+
+    @cached_property
+    def dialog_entities(self) -> set:
+        return set(_ENTITY_RE.findall('\n'.join(self.dialog_lines)))
+
+    @cached_property
+    def long_description(self) -> str:
+        return '\n\n'.join(
+            ask_input_lines('Enter a long description:', '>')
+        ).strip().capitalize()
+
+    @cached_property
+    def readme(self) -> str:
+        return readme_template.format(
+            title_name=self.name.translate(_DASH_TO_SPACE).title(),
+            short_description=self.short_description,
+            long_description=self.long_description,
+            examples=''.join([' - "' + i + '"\n' for i in self.intent_lines]),
+            credits=credits_template.format(author=self.author)
         )
-    ])
-    dialog_lines = Lazy(lambda s: [
-        i.capitalize() for i in ask_input_lines(
-            'Enter what your skill should say to respond:', '-'
+
+    @cached_property
+    def init_file(self) -> str:
+        entities = self.dialog_entities | self.intent_entities
+        return init_template.format(
+            class_name=self.class_name,
+            handler_name=self.intent_name.replace('.', '_'),
+            handler_code='\n'.join(
+                ' ' * 8 * bool(i) + i
+                for i in [
+                    "{ent} = message.data.get('{ent}')".format(ent=entity)
+                    for entity in sorted(self.intent_entities)
+                ] + [
+                    "{ent} = ''".format(ent=entity)
+                    for entity in sorted(self.dialog_entities - self.intent_entities)
+                ] + [''] * bool(entities) + "self.speak_dialog('{intent}'{args})".format(
+                    intent=self.intent_name, args=", data={{\n{}\n}}".format(',\n'.join(
+                        "    '{ent}': {ent}".format(ent=entity)
+                        for entity in entities
+                    )) * bool(entities)
+                ).split('\n')
+            ),
+            intent_name=self.intent_name
+        )
+
+    @cached_property
+    def intent_name(self) -> str:
+        return '.'.join(reversed(self.name.split('-')))
+
+    @cached_property
+    def settingsmeta(self) -> str:
+        return (
+            _settingsmeta_prefix + self.name.translate(_DASH_TO_SPACE).capitalize() +
+            _settingsmeta_suffix
         )
-    ])
-    intent_entities = Lazy(lambda s: set(re.findall(
-        r'(?<={)[a-z_A-Z]*(?=})', '\n'.join(i for i in s.intent_lines)
-    )))
-    dialog_entities = Lazy(lambda s: set(re.findall(
-        r'(?<={)[a-z_A-Z]*(?=})', '\n'.join(s.dialog_lines)
-    )))
-    long_description = Lazy(lambda s: '\n\n'.join(
-        ask_input_lines('Enter a long description:', '>')
-    ).strip().capitalize())
-    readme = Lazy(lambda s: readme_template.format(
-        title_name=s.name.replace('-', ' ').title(),
-        short_description=s.short_description,
-        long_description=s.long_description,
-        examples=''.join(' - "{}"\n'.format(i) for i in s.intent_lines),
-        credits=credits_template.format(author=s.author)
-    ))
-    init_file = Lazy(lambda s: init_template.format(
-        class_name=to_camel(s.name.replace('-', '_')),
-        handler_name=s.intent_name.replace('.', '_'),
-        handler_code='\n'.join(
-            ' ' * 8 * bool(i) + i
-            for i in [
-                "{ent} = message.data.get('{ent}')".format(ent=entity)
-                for entity in sorted(s.intent_entities)
-            ] + [
-                "{ent} = ''".format(ent=entity)
-                for entity in sorted(s.dialog_entities - s.intent_entities)
-            ] + [''] * bool(
-                s.dialog_entities | s.intent_entities
-            ) + "self.speak_dialog('{intent}'{args})".format(
-                intent=s.intent_name, args=", data={{\n{}\n}}".format(',\n'.join(
-                    "    '{ent}': {ent}".format(ent=entity)
-                    for entity in s.dialog_entities | s.intent_entities
-                )) * bool(s.dialog_entities | s.intent_entities)
-            ).split('\n')
-        ),
-        intent_name=s.intent_name
-    ))
-    intent_name = Lazy(lambda s: '.'.join(reversed(s.name.split('-'))))
+
+    gitignore = gitignore_template
 
     def add_vocab(self):
-        makedirs(join(self.path, 'vocab', self.lang))
-        with open(join(self.path, 'vocab', self.lang, self.intent_name + '.intent'), 'w') as f:
-            f.write('\n'.join(self.intent_lines + ['']))
+        folder = Path(self.path, 'vocab', self.lang)
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / (self.intent_name + '.intent')).write_text('\n'.join(self.intent_lines + ['']))
 
     def add_dialog(self):
-        makedirs(join(self.path, 'dialog', self.lang))
-        with open(join(self.path, 'dialog', self.lang, self.intent_name + '.dialog'), 'w') as f:
-            f.write('\n'.join(self.dialog_lines + ['']))
+        folder = Path(self.path, 'dialog', self.lang)
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / (self.intent_name + '.dialog')).write_text('\n'.join(self.dialog_lines + ['']))
+
+    def init_git(self):
+        self.git.init()
+
+    # Template entries mapped to the attribute that creates them. Methods
+    # create the entry themselves, other attributes are the file content.
+    skill_template = (
+        ('vocab', 'add_vocab'),
+        ('dialog', 'add_dialog'),
+        ('__init__.py', 'init_file'),
+        ('README.md', 'readme'),
+        ('.gitignore', 'gitignore'),
+        ('settingsmeta.json', 'settingsmeta'),
+        ('.git', 'init_git')
+    )
 
     def initialize_template(self, files: set = None):
-        git = Git(self.path)
-
-        skill_template = [
-            ('', lambda: makedirs(self.path)),
-            ('vocab', self.add_vocab),
-            ('dialog', self.add_dialog),
-            ('__init__.py', lambda: self.init_file),
-            ('README.md', lambda: self.readme),
-            ('.gitignore', lambda: gitignore_template),
-            ('settingsmeta.json', lambda: settingsmeta_template.format(
-                capital_desc=self.name.replace('-', ' ').capitalize()
-            )),
-            ('.git', lambda: git.init())
-        ]
-
         def cleanup():
             rmtree(self.path)
 
-        if not isdir(self.path):
+        root = Path(self.path)
+        if root.is_dir():
+            existing = {entry.name for entry in scandir(self.path)}
+        else:
             atexit.register(cleanup)
-        for file, handler in skill_template:
+            root.mkdir(parents=True)
+            existing = set()
+        for file, attr in self.skill_template:
             if files and file not in files:
                 continue
-            if not exists(join(self.path, file)):
-                result = handler()
-                if isinstance(result, str) and not exists(join(self.path, file)):
-                    with open(join(self.path, file), 'w') as f:
-                        f.write(result)
+            if file not in existing:
+                value = getattr(self, attr)
+                if callable(value):
+                    value()
+                else:
+                    (root / file).write_text(value)
+                existing.add(file)
         atexit.unregister(cleanup)
 
+    @property
+    def has_origin(self) -> bool:
+        return bool(self.git.config('--get', 'remote.origin.url', with_exceptions=False))
+
     def commit_changes(self):
         if self.git.rev_parse('HEAD', with_exceptions=False) == 'HEAD':
             self.git.add('.')
             self.git.commit(message='Initial commit')
 
-    def force_push(self, get_repo_name: Callable = None) -> Optional[Repository]:
+    def force_push(self, get_repo_name: Callable = None) -> Optional['Repository']:
         if ask_yes_no(
                 'Are you sure you want to overwrite the remote github repo? '
                 'This cannot be undone and you will lose your commit '
@@ -270,8 +353,8 @@ class CreateAction(ConsoleAction):
             print('Force pushed to GitHub repo:', repo.html_url)
             return repo
 
-    def link_github_repo(self, get_repo_name: Callable = None) -> Optional[Repository]:
-        if 'origin' not in Git(self.path).remote().split('\n'):
+    def link_github_repo(self, get_repo_name: Callable = None) -> Optional['Repository']:
+        if not self.has_origin:
             if ask_yes_no(
                     'Would you like to link an existing GitHub repo to it? (Y/n)',
                     True):
@@ -290,9 +373,11 @@ class CreateAction(ConsoleAction):
                 print('Linked and pushed to GitHub repo:', repo.html_url)
                 return repo
 
-    def create_github_repo(self, get_repo_name: Callable = None) -> Optional[Repository]:
-        if 'origin' not in Git(self.path).remote().split('\n'):
+    def create_github_repo(self, get_repo_name: Callable = None) -> Optional['Repository']:
+        if not self.has_origin:
             if ask_yes_no('Would you like to create a GitHub repo for it? (Y/n)', True):
+                from github import GithubException
+
                 repo_name = (get_repo_name and get_repo_name()) or (self.name + '-skill')
                 try:
                     repo = self.user.create_repo(repo_name, self.short_description)
@@ -301,7 +386,7 @@ class CreateAction(ConsoleAction):
                         raise GithubRepoExists(repo_name) from e
                     raise
                 self.git.remote('add', 'origin', repo.html_url)
-                call(['git', 'push', '-u', 'origin', 'master'], cwd=self.git.working_dir)
+                self.git.push('origin', 'master', set_upstream=True)
                 print('Created GitHub repo:', repo.html_url)
                 return repo
         return None
@@ -22,14 +22,17 @@
 from argparse import ArgumentParser
 from genericpath import samefile
 from git import Git
-from github.Repository import Repository
 from msm import MycroftSkillsManager
+from typing import TYPE_CHECKING
 
 from msk.console_action import ConsoleAction
 from msk.exceptions import NotUploaded
 from msk.repo_action import SkillData
 from msk.util import skills_kit_footer, create_or_edit_pr
 
+if TYPE_CHECKING:
+    from github.Repository import Repository
+
 body_template = '''
 'This upgrades {skill_name} to include the following new commits:
 
@@ -56,7 +59,7 @@ class UpgradeAction(ConsoleAction):
     def register(parser: ArgumentParser):
         pass  # Implemented in SubmitAction
 
-    def create_pr_message(self, skill_git: Git, skill_repo: Repository) -> tuple:
+    def create_pr_message(self, skill_git: Git, skill_repo: 'Repository') -> tuple:
         """Reads git commits from skill repo to create a list of changes as the PR content"""
         title = 'Upgrade ' + self.skill.name
         body = body_template.format(
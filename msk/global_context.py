@@ -19,13 +19,16 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from github import Github
-from github.AuthenticatedUser import AuthenticatedUser
 from msm import MycroftSkillsManager
+from typing import TYPE_CHECKING
 
 from msk.lazy import Lazy, unset
 from msk.util import ask_for_github_credentials
 
+if TYPE_CHECKING:
+    from github import Github
+    from github.AuthenticatedUser import AuthenticatedUser
+
 
 class GlobalContext:
     lang = Lazy(unset)  # type: str
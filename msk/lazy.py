@@ -26,19 +26,27 @@ def unset():
     raise NotImplementedError
 
 
+_initial_val = object()
+
+
 class Lazy:
-    """Lazy attribute across all instances"""
-    initial_val = []
+    """
+    Lazy attribute across all instances
+
+    The value is stored on the descriptor rather than in the instance
+    __dict__ since it is shared between every instance of the owner class
+    """
 
     def __init__(self, func):
         wraps(func)(self)
         self.func = func
-        self.return_val = self.initial_val
+        self.return_val = _initial_val
 
     def __set__(self, instance, value):
         self.return_val = value
 
     def __get__(self, instance, owner):
-        if self.return_val is self.initial_val:
-            self.return_val = self.func(instance)
-        return self.return_val
+        return_val = self.return_val
+        if return_val is _initial_val:
+            return_val = self.return_val = self.func(instance)
+        return return_val
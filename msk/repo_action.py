@@ -21,22 +21,25 @@
 # under the License.
 from contextlib import suppress
 from git import Git, GitCommandError
-from github.Repository import Repository
 from msm import SkillRepo, SkillEntry
 from os.path import join
 from subprocess import call
+from typing import TYPE_CHECKING
 
 from msk.exceptions import AlreadyUpdated, NotUploaded
 from msk.global_context import GlobalContext
 from msk.lazy import Lazy
 from msk.util import skill_repo_name
 
+if TYPE_CHECKING:
+    from github.Repository import Repository
+
 
 class RepoData(GlobalContext):
     msminfo = Lazy(lambda s: s.msm.repo)  # type: SkillRepo
     git = Lazy(lambda s: Git(s.msminfo.path))  # type: Git
     hub = Lazy(lambda s: s.github.get_repo(skill_repo_name(s.msminfo.url)))  # type: Repository
-    fork = Lazy(lambda s: s.github.get_user().create_fork(s.hub))  # type: Repository
+    fork = Lazy(lambda s: s.user.create_fork(s.hub))  # type: Repository
 
     def push_to_fork(self, branch: str):
         remotes = self.git.remote().split('\n')
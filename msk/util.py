@@ -26,17 +26,19 @@ from contextlib import contextmanager
 from difflib import SequenceMatcher
 from functools import wraps
 from getpass import getpass
-from github import Github, GithubException
-from github.Repository import Repository
 from msm import SkillEntry
 from os import chmod
 from os.path import join
 from tempfile import mkstemp
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from msk import __version__
 from msk.exceptions import PRModified, MskException, SkillNameTaken
 
+if TYPE_CHECKING:
+    from github import Github
+    from github.Repository import Repository
+
 ASKPASS = '''#!/usr/bin/env python3
 import sys
 print(
@@ -62,7 +64,9 @@ def register_git_injector(username, password):
     os.environ['GIT_ASKPASS'] = tmp_path
 
 
-def ask_for_github_credentials(use_token=False) -> Github:
+def ask_for_github_credentials(use_token=False) -> 'Github':
+    from github import Github, GithubException
+
     print('=== GitHub Credentials ===')
     while True:
         if use_token:
@@ -148,7 +152,7 @@ def ask_yes_no(message: str, default: Optional[bool]) -> bool:
     return {'n': False, 'y': True, '': default}[resp.lower()]
 
 
-def create_or_edit_pr(title: str, body: str, skills_repo: Repository,
+def create_or_edit_pr(title: str, body: str, skills_repo: 'Repository',
                       user, branch: str, repo_branch: str):
     base = repo_branch
     head = '{}:{}'.format(user.login, branch)
@@ -161,6 +165,8 @@ def create_or_edit_pr(title: str, body: str, skills_repo: Repository,
             raise PRModified('Not updating description since it was not autogenerated')
         return pull
     else:
+        from github import GithubException
+
         try:
             return skills_repo.create_pull(title, body, base=base, head=head)
         except GithubException as e:
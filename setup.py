@@ -25,6 +25,7 @@ setup(
     name='msk',
     version='0.3.12',  # Also update in msk/__init__.py
     packages=['msk', 'msk.actions'],
+    python_requires='>=3.8',
     install_requires=['GitPython', 'typing', 'msm>=0.5.13', 'pygithub'],
     url='https://github.com/MycroftAI/mycroft-skills-kit',
     license='Apache-2.0',